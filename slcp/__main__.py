@@ -18,7 +18,7 @@ def main():
     print(handler.message)
     handler.log.logger.info(handler.message)
     handler.process()
-    handler.log.logger.info(f"Process finished\n")
+    handler.log.logger.info("Process finished\n")
     handler.log.close()
 
 
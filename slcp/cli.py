@@ -9,6 +9,94 @@ PyPi: https://pypi.org/project/slcp/
 
 import os
 from argparse import ArgumentParser
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _build_parser():
+    """
+    Construct the ArgumentParser with all slcp arguments.
+    Memoized so repeated ArgParser instantiations reuse one parser.
+    :return: argparse.ArgumentParser. Constructed parser.
+    """
+    parser = ArgumentParser(
+        usage="slcp ext [ext ...] [-s SRC] [-d DST] [-sc | -dc] "
+        "[-p] [-i] [-m | -hl] [-mt] [-e FILE [FILE ...]] [-c N] [-l] [-h]",
+        description="Copy all files with given extensions from a directory and its subfolders "
+        "to another directory. "
+        "A destination folder must be outside of a source folder.",
+    )
+    parser.add_argument(
+        "ext",
+        nargs="+",
+        help="one or more extensions, enter without a dot, separate by spaces",
+    )
+    parser.add_argument("-s", "--source", help="source folder path", metavar="SRC")
+    parser.add_argument("-d", "--dest", help="destination folder path", metavar="DST")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        "-sc",
+        "--srccwd",
+        action="store_true",
+        help="use current working directory as a source",
+    )
+    group.add_argument(
+        "-dc",
+        "--dstcwd",
+        action="store_true",
+        help="use current working directory as a destination",
+    )
+    parser.add_argument(
+        "-p",
+        "--preserve",
+        action="store_true",
+        help="preserve source folder structure",
+    )
+    parser.add_argument(
+        "-i",
+        "--invert",
+        action="store_true",
+        help="process only files without given extensions",
+    )
+    action_group = parser.add_mutually_exclusive_group()
+    action_group.add_argument(
+        "-m", "--move", action="store_true", help="move files instead of copying"
+    )
+    action_group.add_argument(
+        "-hl",
+        "--hardlink",
+        action="store_true",
+        help="hardlink files instead of copying, "
+        "falls back to copying across filesystems",
+    )
+    parser.add_argument(
+        "-mt",
+        "--metadata",
+        action="store_true",
+        help="preserve file metadata while copying",
+    )
+    parser.add_argument(
+        "-e",
+        "--exclude",
+        nargs="+",
+        help="exclude certain files from processing",
+        metavar="FILE",
+    )
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=8,
+        help="number of files to process concurrently, default is 8",
+        metavar="N",
+    )
+    parser.add_argument(
+        "-l",
+        "--log",
+        action="store_true",
+        help="create and save log to the destination folder",
+    )
+    return parser
 
 
 class ArgParser:
@@ -16,71 +104,13 @@ class ArgParser:
 
     def __init__(self):
         """Parse command line arguments, format given extensions and arguments containing paths."""
-        self.parser = ArgumentParser(
-            usage="slcp ext [ext ...] [-s SRC] [-d DST] [-sc | -dc] "
-            "[-p] [-i] [-m] [-e FILE [FILE ...]] [-l] [-h]",
-            description="Copy all files with given extensions from a directory and its subfolders "
-            "to another directory. "
-            "A destination folder must be outside of a source folder.",
-        )
-        self.parser.add_argument(
-            "ext",
-            nargs="+",
-            help="one or more extensions, enter without a dot, separate by spaces",
-        )
-        self.parser.add_argument(
-            "-s", "--source", help="source folder path", metavar="SRC"
-        )
-        self.parser.add_argument(
-            "-d", "--dest", help="destination folder path", metavar="DST"
-        )
-        group = self.parser.add_mutually_exclusive_group()
-        group.add_argument(
-            "-sc",
-            "--srccwd",
-            action="store_true",
-            help="use current working directory as a source",
-        )
-        group.add_argument(
-            "-dc",
-            "--dstcwd",
-            action="store_true",
-            help="use current working directory as a destination",
-        )
-        self.parser.add_argument(
-            "-p",
-            "--preserve",
-            action="store_true",
-            help="preserve source folder structure",
-        )
-        self.parser.add_argument(
-            "-i",
-            "--invert",
-            action="store_true",
-            help="process only files without given extensions",
-        )
-        self.parser.add_argument(
-            "-m", "--move", action="store_true", help="move files instead of copying"
-        )
-        self.parser.add_argument(
-            "-e",
-            "--exclude",
-            nargs="+",
-            help="exclude certain files from processing",
-            metavar="FILE",
-        )
-        self.parser.add_argument(
-            "-l",
-            "--log",
-            action="store_true",
-            help="create and save log to the destination folder",
-        )
+        self.parser = _build_parser()
         self.args = self.parser.parse_args()
-        self.args.ext = tuple(set(f".{item}" for item in self.args.ext))
+        self.args.ext = tuple(dict.fromkeys(f".{item}" for item in self.args.ext))
         if self.args.source:
             self.args.source = os.path.normpath(self.args.source.strip())
         if self.args.dest:
             self.args.dest = os.path.normpath(self.args.dest.strip())
         self.args.exclude = (
-            tuple(set(self.args.exclude)) if self.args.exclude else tuple()
+            frozenset(self.args.exclude) if self.args.exclude else frozenset()
         )
@@ -8,6 +8,7 @@ PyPi: https://pypi.org/project/slcp/
 
 
 import logging
+import logging.handlers
 import os
 
 
@@ -25,6 +26,8 @@ class Log:
         self.logger = logging.getLogger("slcp")
         self.logger.setLevel(logging.CRITICAL)
         self.log = args.log
+        # short-circuit record handling entirely when logging is off
+        self.logger.disabled = not self.log
         if self.log:
             self.logger.setLevel(logging.INFO)
             fh = logging.FileHandler(
@@ -34,14 +37,22 @@ class Log:
                 "%(asctime)s %(message)s", "%d.%m.%Y %H:%M:%S"
             )
             fh.setFormatter(formatter)
-            self.logger.addHandler(fh)
+            # buffer records in memory and flush them to the file in batches
+            # so the copy loop is not stalled by a write syscall per record
+            mh = logging.handlers.MemoryHandler(
+                capacity=512, flushLevel=logging.ERROR, target=fh
+            )
+            self.logger.addHandler(mh)
 
     def close(self):
         """
-        Close selective_copy.log file and remove it from logger
-        file handlers if logging is turned on in command line arguments.
+        Flush buffered records, close slcp.log file and remove handlers
+        from logger if logging is turned on in command line arguments.
         :return: NoneType.
         """
         if self.log:
-            self.logger.handlers[0].close()
+            mh = self.logger.handlers[0]
+            mh.flush()
+            mh.target.close()
+            mh.close()
             self.logger.handlers = []
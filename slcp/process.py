@@ -7,14 +7,50 @@ PyPi: https://pypi.org/project/slcp/
 """
 
 
+import logging
 import os
 import shutil
 import sys
-from tkinter.filedialog import askdirectory
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from slcp.log import Log
 
 
+def _hardlink(src, dst):
+    """
+    Hardlink a file into the destination - a single metadata-only syscall
+    that moves no bytes regardless of file size. Fall back to a plain copy
+    when linking is not possible, e.g. across filesystems, recording the
+    substitution in the log.
+    :param src: str. Source file path.
+    :param dst: str. Destination file path.
+    :return: NoneType.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+        logging.getLogger("slcp").info("*%s hardlink failed, copied instead", src)
+
+
+def _move(src, dst):
+    """
+    Move a file, preferring os.replace - a single metadata-only rename
+    syscall when source and destination share a filesystem. Fall back to
+    a metadata-preserving copy and unlink when the rename fails,
+    e.g. across devices.
+    :param src: str. Source file path.
+    :param dst: str. Destination file path.
+    :return: NoneType.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+        os.unlink(src)
+
+
 class Handler:
     """File processing handler."""
 
@@ -27,13 +63,27 @@ class Handler:
         self.source = self.select_source()
         self.destination = self.select_destination()
         self.log = Log(args, self.destination)
+        self._name_cache = {}
         self.todo = self.get_todo()
         self.total = len(self.todo)
-        self.action = shutil.move if args.move else shutil.copy
+        if args.move:
+            self.action = _move
+        elif args.hardlink:
+            self.action = _hardlink
+        elif args.metadata:
+            self.action = shutil.copy2
+        else:
+            self.action = shutil.copyfile
         self.excluded = ", ".join(args.exclude)
         self.processed = 0
+        try:
+            self._term_width = os.get_terminal_size(0)[0]
+        except OSError:
+            self._term_width = 80
+        self._last_update = 0.0
+        self._tty = sys.stdout.isatty()
         self.message = (
-            f'{"Moving" if args.move else "Copying"} '
+            f'{"Moving" if args.move else "Hardlinking" if args.hardlink else "Copying"} '
             f'{self.total} file{"s" if self.total > 1 else ""} '
             f'{"without" if args.invert else "with"} '
             f'{", ".join(args.ext)} extension{"s" if len(args.ext) > 1 else ""} '
@@ -44,7 +94,7 @@ class Handler:
         try:
             self.check_for_errors()
         except Exception as e:
-            self.log.logger.error(f"{e}\n")
+            self.log.logger.error("%s\n", e)
             self.log.close()
             sys.exit(e)
 
@@ -58,6 +108,10 @@ class Handler:
             source = os.getcwd()
         else:
             if self.args.source is None:
+                # tkinter costs tens of milliseconds to initialize, so it is
+                # imported only when a filedialog is actually needed
+                from tkinter.filedialog import askdirectory
+
                 print("Choose a source path.")
                 source = os.path.normpath(askdirectory())
                 print(f"Source path: {source}")
@@ -76,6 +130,8 @@ class Handler:
             destination = os.getcwd()
         else:
             if self.args.dest is None:
+                from tkinter.filedialog import askdirectory
+
                 print("Choose a destination path.")
                 destination = os.path.normpath(askdirectory())
                 print(f"Destination path: {destination}")
@@ -87,53 +143,92 @@ class Handler:
 
     def get_todo(self):
         """
-        Create a to-do list where each sublist represents one file and contains
-        source and destination paths for this file.
-        :return: list of list of str. To-do list.
+        Create a to-do list where each tuple represents one file and contains
+        source path, planned destination path, destination folder, final
+        filename and a flag telling whether the file was renamed to avoid a
+        collision. Collisions are resolved here, against both the files
+        already present in a destination folder and the other planned files,
+        so the copy workers run without filesystem checks or races.
+        :return: list of tuple. To-do list.
         """
         todo_list = []
+        # bind loop invariants to locals so the inner loop does LOAD_FAST
+        # instead of attribute lookup chains per entry
+        append = todo_list.append
+        sep = os.sep
+        preserve = self.args.preserve
+        invert = self.args.invert
+        exclude = self.args.exclude
+        # match extensions case-insensitively so e.g. 'slcp jpg' also picks
+        # up .JPG files, which camera filesystems commonly produce
+        ext = tuple(item.lower() for item in self.args.ext)
         try:
-            os.chdir(self.source)
-            for foldername, _, filenames in os.walk(self.source):
-                if self.args.preserve:
+            if preserve:
+                dest_root = os.path.join(
+                    self.destination,
+                    f'{"not_" if invert else ""}'
+                    f'{"_".join(self.args.ext).replace(".", "")}'
+                    f"_{os.path.basename(self.source)}",
+                )
+            stack = [self.source]
+            while stack:
+                foldername = stack.pop()
+                parent = os.path.basename(foldername)
+                if preserve:
                     path = os.path.join(
-                        self.destination,
-                        f'{"not_" if self.args.invert else ""}'
-                        f'{"_".join(self.args.ext).replace(".", "")}'
-                        f"_{os.path.basename(self.source)}",
-                        os.path.relpath(foldername),
+                        dest_root, os.path.relpath(foldername, self.source)
                     )
-                for filename in filenames:
-                    if (
-                        filename.endswith(self.args.ext) ^ self.args.invert
-                    ) and filename not in self.args.exclude:
-                        if self.args.preserve:
-                            todo_list.append(
-                                [
-                                    os.path.join(foldername, filename),
-                                    os.path.join(path, filename),
-                                ]
-                            )
-                        else:
-                            todo_list.append(
-                                [
-                                    os.path.join(foldername, filename),
-                                    os.path.join(self.destination, filename),
-                                ]
-                            )
+                else:
+                    path = self.destination
+                # plain concatenation with a precomputed prefix is cheaper
+                # than an os.path.join call per file
+                prefix = path + sep
+                names = self._dest_names(path)
+                try:
+                    entries = os.scandir(foldername)
+                except OSError:
+                    # unreadable or vanished folder: skip it and keep
+                    # walking, as os.walk did
+                    continue
+                with entries:
+                    for entry in entries:
+                        name = entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                        try:
+                            # symlink to a folder: neither descend into it
+                            # nor treat it as a file
+                            if entry.is_dir():
+                                continue
+                        except OSError:
+                            # unresolvable symlink, e.g. a loop: classify it
+                            # as a file like os.walk did, so the error
+                            # surfaces per file in _process_one
+                            pass
+                        if (
+                            name.lower().endswith(ext) ^ invert
+                        ) and name not in exclude:
+                            renamed = name in names
+                            if renamed:
+                                name = f"{parent}_{name}"
+                            names.add(name)
+                            append((entry.path, prefix + name, path, name, renamed))
         except FileNotFoundError:
             pass
         return todo_list
 
     def check_for_errors(self):
         """Check for errors, raise corresponding Exception if any errors occurred."""
-        if not os.path.exists(self.source):
+        source = os.path.abspath(self.source)
+        destination = os.path.abspath(self.destination)
+        if not os.path.exists(source):
             raise Exception(f"Error: Source path {self.source} does not exist.")
         elif self.total == 0:
             raise Exception(
                 f'Error: There are no {", ".join(self.args.ext)} files in {self.source}.'
             )
-        elif os.path.commonpath([self.source, self.destination]) == self.source:
+        elif os.path.commonpath([source, destination]) == source:
             raise Exception(
                 f"Error: A destination folder must be outside of source folder. "
                 f"Paths given: source - {self.source} | destination - {self.destination}."
@@ -144,40 +239,74 @@ class Handler:
     def process(self):
         """
         Copy or move files according to source and destination paths
-        given in self.todo_list. Each item in this list represents one file.
-        item[0] - source, item[1] - destination.
+        given in self.todo. Each item in this list represents one file.
+        Files are processed by a thread pool since the work consists of
+        blocking I/O syscalls that release the GIL; destination folders
+        are created up front to keep the workers free of races.
         :return: NoneType.
         """
         self._show_progress_bar()
-        for item in self.todo:
-            if not os.path.exists(os.path.dirname(item[1])):
-                os.makedirs(os.path.dirname(item[1]))
+        for folder in {item[2] for item in self.todo}:
+            os.makedirs(folder, exist_ok=True)
+        workers = max(1, self.args.concurrency)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self._process_one, item) for item in self.todo]
+            for _ in as_completed(futures):
+                self.processed += 1
+                self._show_progress_bar()
+
+    def _process_one(self, item):
+        """
+        Copy or move one file to the destination planned for it in get_todo.
+        :param item: tuple. Source path, destination path, destination folder,
+        final filename and the renamed-on-collision flag of one file.
+        :return: NoneType.
+        """
+        src, dst, _, filename, renamed = item
+        try:
+            if renamed:
+                self.log.logger.info("*%s saving it as %s", src, filename)
+            else:
+                self.log.logger.info("%s", src)
+            self.action(src, dst)
+        except Exception as e:
+            self.log.logger.error("*Unable to process %s, an error occurred: %s", src, e)
+
+    def _dest_names(self, folder):
+        """
+        Return the set of filenames already present in a destination folder,
+        scanning the folder once on first access and serving the cached set
+        afterwards instead of a stat syscall per file.
+        :param folder: str. Destination folder path.
+        :return: set of str. Filenames in the folder.
+        """
+        names = self._name_cache.get(folder)
+        if names is None:
             try:
-                if not os.path.exists(item[1]):
-                    self.log.logger.info(f"{item[0]}")
-                    self.action(item[0], item[1])
-                else:
-                    new_filename = f"{os.path.basename(os.path.dirname(item[0]))}_{os.path.basename(item[1])}"
-                    self.log.logger.info(f"*{item[0]} saving it as {new_filename}")
-                    self.action(
-                        item[0], os.path.join(os.path.dirname(item[1]), new_filename)
-                    )
-            except Exception as e:
-                self.log.logger.error(
-                    f"*Unable to process {item[0]}, an error occurred: {e}"
-                )
-            self.processed += 1
-            self._show_progress_bar()
+                with os.scandir(folder) as entries:
+                    names = {entry.name for entry in entries}
+            except FileNotFoundError:
+                names = set()
+            self._name_cache[folder] = names
+        return names
 
     def _show_progress_bar(self):
         """
-        Print progress bar.
+        Print progress bar. Intermediate updates are throttled to about
+        30 per second so terminal writes stay off the hot path; the first
+        and the final updates are always printed. When stdout is not a
+        terminal only the final state is printed, since carriage-return
+        redraws are just noise in redirected output.
         :return: NoneType.
         """
-        try:
-            term_width = os.get_terminal_size(0)[0]
-        except OSError:
-            term_width = 80
+        if self.processed < self.total:
+            if not self._tty:
+                return
+            now = time.monotonic()
+            if self.processed > 0 and now - self._last_update < 0.033:
+                return
+            self._last_update = now
+        term_width = self._term_width
         length = term_width - (len(str(self.total)) + 33)
         percent = round(100 * (self.processed / self.total))
         filled = int(length * self.processed // self.total)
@@ -189,6 +318,7 @@ class Handler:
             if self.args.log
             else "Done           "
         )
-        print(f"\rProgress: {bar} {percent}% {suffix}", end="\r", flush=True)
+        sys.stdout.write("\rProgress: %s %d%% %s\r" % (bar, percent, suffix))
         if self.processed == self.total:
-            print()
+            sys.stdout.write("\n")
+        sys.stdout.flush()